@@ -0,0 +1,92 @@
+import os
+import time
+import numpy as np
+import tensorflow as tf
+from datetime import timedelta
+from sklearn.model_selection import train_test_split
+from kgcnn.data.datasets.QM9Dataset import QM9Dataset
+from kgcnn.literature.NMPN import make_model
+from kgcnn.training.scheduler import LinearLearningRateScheduler
+
+# Example training script for NMPN on the LUMO orbital energy of QM9.
+# Model and data settings follow ``training/hyper/hyper_qm9_orbitals.py``.
+
+model_config = {
+    "name": "NMPN",
+    "inputs": [{"shape": [None], "name": "node_number", "dtype": "float32", "ragged": True},
+               {"shape": [None, 3], "name": "node_coordinates", "dtype": "float32", "ragged": True},
+               {"shape": [None, 2], "name": "edge_indices", "dtype": "int64", "ragged": True}],
+    "input_embedding": {"node": {"input_dim": 95, "output_dim": 64},
+                        "edge": {"input_dim": 5, "output_dim": 64}},
+    "set2set_args": {"channels": 32, "T": 3, "pooling_method": "sum", "init_qstar": "0"},
+    "pooling_args": {"pooling_method": "segment_sum"},
+    "use_set2set": True,
+    "depth": 3,
+    "node_dim": 128,
+    "geometric_edge": True, "make_distance": True, "expand_distance": True,
+    "output_embedding": "graph",
+    "output_mlp": {"use_bias": [True, True, False], "units": [25, 25, 1],
+                   "activation": ["selu", "selu", "linear"]},
+}
+
+# Index of the LUMO energy in the QM9 labels 'A', 'B', 'C', 'mu', 'alpha', 'homo', 'lumo', ...
+target_index = 6
+
+dataset = QM9Dataset()
+dataset.map_list(method="set_range", max_distance=4, max_neighbours=30)
+dataset.clean(model_config["inputs"])
+# Labels and graph tensors are kept in float32. The graph input is already packed as float32 via
+# the dtype of the keras input spec, which also halves the on-disk tensor cache below.
+labels = np.array(dataset.obtain_property("graph_labels"), dtype="float32")[:, target_index:target_index + 1]
+
+
+# Stream per-graph numpy arrays straight from the dataset properties instead of packing all
+# ~130k graphs into one ragged tensor upfront. This supersedes the previous on-disk tensor
+# cache; with tf.data caching below the generator only runs in the first epoch.
+input_properties = [dataset.obtain_property(x["name"]) for x in model_config["inputs"]]
+input_dtypes = [x["dtype"] for x in model_config["inputs"]]
+output_signature = (
+    tuple(tf.TensorSpec(shape=tuple(x["shape"]), dtype=x["dtype"]) for x in model_config["inputs"]),
+    tf.TensorSpec(shape=labels.shape[1:], dtype=labels.dtype))
+
+
+def graph_generator(index_list):
+    """Make a generator yielding (inputs, label) numpy tuples for the given graph indices."""
+    def generate():
+        for i in index_list:
+            yield tuple(
+                np.asarray(prop[i], dtype=dtype) for prop, dtype in zip(input_properties, input_dtypes)), labels[i]
+    return generate
+
+
+# Random 10% test split.
+train_index, test_index = train_test_split(np.arange(len(dataset)), test_size=0.1, random_state=42)
+
+# Build and compile under a MirroredStrategy scope to train data-parallel on all visible GPUs.
+# With a single (or no) GPU the strategy reduces to normal execution.
+strategy = tf.distribute.MirroredStrategy()
+print("Number of replicas in sync:", strategy.num_replicas_in_sync)
+with strategy.scope():
+    model = make_model(**model_config)
+    model.compile(loss="mean_absolute_error",
+                  optimizer=tf.keras.optimizers.Adam(learning_rate=1e-04),
+                  metrics=["mean_absolute_error"])
+print(model.summary())
+
+# Feed training data via tf.data so examples are cached after the first epoch and the input
+# pipeline overlaps with the training step. Variable sized graphs are batched into ragged
+# tensors directly by the pipeline.
+train_data = tf.data.Dataset.from_generator(graph_generator(train_index), output_signature=output_signature)
+train_data = train_data.cache().shuffle(10000).apply(
+    tf.data.experimental.dense_to_ragged_batch(32)).prefetch(tf.data.AUTOTUNE)
+test_data = tf.data.Dataset.from_generator(graph_generator(test_index), output_signature=output_signature)
+test_data = test_data.apply(tf.data.experimental.dense_to_ragged_batch(32)).cache().prefetch(tf.data.AUTOTUNE)
+
+start = time.process_time()
+hist = model.fit(train_data,
+                 validation_data=test_data,
+                 epochs=700, validation_freq=10, verbose=2,
+                 callbacks=[LinearLearningRateScheduler(
+                     learning_rate_start=1e-04, learning_rate_stop=1e-05, epo_min=50, epo=700)])
+stop = time.process_time()
+print("Time for training:", str(timedelta(seconds=stop - start)))
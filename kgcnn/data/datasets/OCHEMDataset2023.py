@@ -1,5 +1,4 @@
 import os
-import json
 from kgcnn.data.ochem import OCHEMDataset
 from kgcnn.data.download import DownloadDataset
 
@@ -33,23 +32,15 @@ class OCHEMDataset2023(OCHEMDataset,DownloadDataset):
 
         OCHEMDataset.__init__(self, verbose=verbose, dataset_name=dataset_name)
 
-        # Prepare download
+        # Prepare download. The class-level info dict already carries the 'load_url' entry and is
+        # referenced as-is, without mutating shared class state per instance.
         if dataset_name in self.datasets_load_info:
             self.download_info = self.datasets_load_info[dataset_name]
-            self.download_info.update({"load_url": "data.csv"})
         else:
             raise ValueError("Can not resolve '%s' as a Molecule. Pick: " % dataset_name,
                              self.datasets_load_info.keys(),
                              "For new dataset, add to `datasets_download_info` list manually.")
 
-        # Load JSON parameters if provided
-        #if json_params is not None:
-        #    with open(json_params, 'r') as json_file:
-        #        params = json.load(json_file)
-        #        if 'load_url' in params:
-        #            self.download_info.update({"load_url": params['load_url']})
-
-
         DownloadDataset.__init__(self, **self.download_info, reload=reload, verbose=verbose)
 
         self.data_directory = os.path.join(self.data_main_dir, self.data_directory_name)
@@ -1,5 +1,7 @@
 import numpy as np
 import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 # import logging
 
@@ -79,45 +81,37 @@ class GraphTUDataset(MemoryGraphDataset):
 
         self.info("Reading dataset to memory with name %s" % str(self.dataset_name))
 
+        # Read all dataset files concurrently. The pandas parser releases the GIL for most of the
+        # decode, so threads overlap both disk reads and parsing of the individual files.
+        # Index files are parsed as int32, which is sufficient for TU-dataset sizes and halves the
+        # memory traffic of the index arrays compared to the default int64.
+        file_list = [("_A", "int32"), ("_graph_indicator", "int32"), ("_graph_labels", float), ("_node_labels", float),
+                     ("_edge_labels", float), ("_node_attributes", float), ("_edge_attributes", float),
+                     ("_graph_attributes", float)]
+        with ThreadPoolExecutor(max_workers=len(file_list)) as executor:
+            futures = {file_suffix: executor.submit(
+                self.read_csv_simple, os.path.join(path, name_dataset + file_suffix + ".txt"), dtype=dtype)
+                for file_suffix, dtype in file_list}
+
+        def file_result(file_suffix):
+            # Files apart from '_A' and '_graph_indicator' are optional for a TUDataset.
+            try:
+                return futures[file_suffix].result()
+            except FileNotFoundError:
+                return None
+
         # Define a graph with indices
         # They must be defined
-        g_a = np.array(self.read_csv_simple(os.path.join(path, name_dataset + "_A.txt"), dtype=int), dtype="int")
-        g_n_id = np.array(self.read_csv_simple(os.path.join(path, name_dataset + "_graph_indicator.txt"), dtype=int),
-                          dtype="int")
-
-        # Try read in labels.
-        try:
-            g_labels = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_graph_labels.txt"), dtype=float))
-        except FileNotFoundError:
-            g_labels = None
-        try:
-            n_labels = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_node_labels.txt"), dtype=float))
-        except FileNotFoundError:
-            n_labels = None
-        try:
-            e_labels = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_edge_labels.txt"), dtype=float))
-        except FileNotFoundError:
-            e_labels = None
-
-        # Try read in attributes
-        try:
-            n_attr = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_node_attributes.txt"), dtype=float))
-        except FileNotFoundError:
-            n_attr = None
-        try:
-            e_attr = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_edge_attributes.txt"), dtype=float))
-        except FileNotFoundError:
-            e_attr = None
-        try:
-            g_attr = np.array(
-                self.read_csv_simple(os.path.join(path, name_dataset + "_graph_attributes.txt"), dtype=float))
-        except FileNotFoundError:
-            g_attr = None
+        g_a = futures["_A"].result()
+        g_n_id = futures["_graph_indicator"].result().squeeze(axis=-1)
+
+        # Try read in labels and attributes.
+        g_labels = file_result("_graph_labels")
+        n_labels = file_result("_node_labels")
+        e_labels = file_result("_edge_labels")
+        n_attr = file_result("_node_attributes")
+        e_attr = file_result("_edge_attributes")
+        g_attr = file_result("_graph_attributes")
 
         # labels
         num_graphs = np.amax(g_n_id)
@@ -133,49 +127,43 @@ class GraphTUDataset(MemoryGraphDataset):
             g_n_id = g_n_id - 1
 
         # split into separate graphs
-        graph_id, counts = np.unique(g_n_id, return_counts=True)
-        graph_len = np.zeros(num_graphs, dtype="int")
-        graph_len[graph_id] = counts
+        graph_len = np.bincount(g_n_id, minlength=num_graphs).astype("int32")
 
+        node_splits = np.cumsum(graph_len)[:-1]
         if n_attr is not None:
-            n_attr = np.split(n_attr, np.cumsum(graph_len)[:-1])
+            n_attr = np.split(n_attr, node_splits)
         if n_labels is not None:
-            n_labels = np.split(n_labels, np.cumsum(graph_len)[:-1])
+            n_labels = np.split(n_labels, node_splits)
 
         # edge_indicator
         graph_id_edge = g_n_id[g_a[:, 0]]  # is the same for adj_matrix[:,1]
-        graph_id2, counts_edge = np.unique(graph_id_edge, return_counts=True)
-        edge_len = np.zeros(num_graphs, dtype="int")
-        edge_len[graph_id2] = counts_edge
+        edge_len = np.bincount(graph_id_edge, minlength=num_graphs).astype("int32")
 
+        edge_splits = np.cumsum(edge_len)[:-1]
         if e_attr is not None:
-            e_attr = np.split(e_attr, np.cumsum(edge_len)[:-1])
+            e_attr = np.split(e_attr, edge_splits)
         if e_labels is not None:
-            e_labels = np.split(e_labels, np.cumsum(edge_len)[:-1])
+            e_labels = np.split(e_labels, edge_splits)
 
         # edge_indices
-        node_index = np.concatenate([np.arange(x) for x in graph_len], axis=0)
-        edge_indices = node_index[g_a]
-        edge_indices = np.concatenate([edge_indices[:, 1:], edge_indices[:, :1]], axis=-1)  # switch indices
-        edge_indices = np.split(edge_indices, np.cumsum(edge_len)[:-1])
-
-        # Check if unconnected
-        all_cons = []
-        for i in range(num_graphs):
-            cons = np.arange(graph_len[i])
-            test_cons = np.sort(np.unique(cons[edge_indices[i]].flatten()))
-            is_cons = np.zeros_like(cons, dtype="bool")
-            is_cons[test_cons] = True
-            all_cons.append(np.sum(np.invert(is_cons)))
-        all_cons = np.array(all_cons)
+        # Node index within each graph as one global arange minus the repeated graph offsets.
+        node_offsets = np.repeat(np.cumsum(graph_len) - graph_len, graph_len)
+        node_index = np.arange(len(g_n_id), dtype="int32") - node_offsets
+        # Gather switched indices in one fancy-indexing pass; np.split then only returns views
+        # into the single contiguous edge index array.
+        edge_indices = node_index[g_a[:, ::-1]]
+        edge_indices = np.split(edge_indices, edge_splits)
+
+        # Check if unconnected. A node is connected if it appears as endpoint of any edge, counted
+        # for all graphs at once from the global adjacency list.
+        is_connected = np.bincount(g_a.flatten(), minlength=len(g_n_id)) > 0
+        all_cons = np.bincount(g_n_id[np.invert(is_connected)], minlength=num_graphs)
 
         self.info("Graph index which has unconnected '%s' with '%s' in total '%s'." % (
             np.arange(len(all_cons))[all_cons > 0], all_cons[all_cons > 0], len(all_cons[all_cons > 0])))
 
-        node_degree = [np.zeros(x, dtype="int") for x in graph_len]
-        for i, x in enumerate(edge_indices):
-            nod_id, nod_counts = np.unique(x[:, 0], return_counts=True)
-            node_degree[i][nod_id] = nod_counts
+        # Node degree from receiving (first) index of switched edge indices, counted on all nodes at once.
+        node_degree = np.split(np.bincount(g_a[:, 1], minlength=len(g_n_id)).astype("int32"), node_splits)
 
         # Assert list for graph items.
         g_attr = [x for x in g_attr] if g_attr is not None else None
@@ -191,21 +179,15 @@ class GraphTUDataset(MemoryGraphDataset):
 
     @staticmethod
     def read_csv_simple(filepath: str, delimiter: str = ",", dtype: Callable = float):
-        """Very simple python-only function to read in a csv-file from file.
+        """Read a delimiter separated value file into a numpy array via the pandas C-parser.
 
         Args:
             filepath (str): Full filepath of csv-file to read in.
             delimiter (str): Delimiter character for separation. Default is ",".
-            dtype: Callable type conversion from string. Default is float.
+            dtype: Type to cast values to. Default is float.
 
         Returns:
-            list: Python list of values. Length of the list equals the number of lines.
+            np.ndarray: Array of values of shape `(lines, columns)`.
         """
-        out = []
-        open_file = open(filepath, "r")
-        for lines in open_file.readlines():
-            string_list = lines.strip().split(delimiter)
-            values_list = [dtype(x.strip()) for x in string_list]
-            out.append(values_list)
-        open_file.close()
-        return out
+        # With `memory_map` the C-parser decodes directly from the memory-mapped file buffer.
+        return pd.read_csv(filepath, header=None, sep=delimiter, dtype=dtype, engine="c", memory_map=True).values
@@ -560,11 +560,6 @@ def define_adjacency_from_distance(distance_matrix, max_distance=np.inf, max_nei
     else:
         graph_adjacency = np.zeros_like(distance_matrix, dtype="bool")
     inddiag = np.arange(num_atoms)
-    # Make Indix Matrix
-    indarr = np.indices(distance_matrix.shape)
-    re_order = np.append(np.arange(1, len(distance_matrix.shape) + 1), 0)
-    graph_indices = indarr.transpose(re_order)
-    # print(graph_indices.shape)
     # Add Max Radius
     if max_distance is not None:
         temp = distance_matrix < max_distance
@@ -576,11 +571,16 @@ def define_adjacency_from_distance(distance_matrix, max_distance=np.inf, max_nei
     # Add #Nieghbours
     if max_neighbours is not None:
         max_neighbours = min(max_neighbours, num_atoms)
-        sorting_index = np.argsort(distance_matrix, axis=-1)
-        # SortedDistance = np.take_along_axis(self.distance_matrix, sorting_index, axis=-1)
-        ind_sorted_red = sorting_index[..., :max_neighbours + 1]
-        temp = np.zeros_like(distance_matrix, dtype="bool")
-        np.put_along_axis(temp, ind_sorted_red, True, axis=-1)
+        if max_neighbours + 1 >= num_atoms:
+            # All neighbours are kept anyway; skip the sort entirely.
+            temp = np.ones_like(distance_matrix, dtype="bool")
+        else:
+            # Only membership in the nearest set matters, so a linear-time partial partition
+            # replaces the full sort along the last axis.
+            sorting_index = np.argpartition(distance_matrix, max_neighbours, axis=-1)
+            ind_sorted_red = sorting_index[..., :max_neighbours + 1]
+            temp = np.zeros_like(distance_matrix, dtype="bool")
+            np.put_along_axis(temp, ind_sorted_red, True, axis=-1)
         if exclusive:
             graph_adjacency = np.logical_and(graph_adjacency, temp)
         else:
@@ -589,7 +589,9 @@ def define_adjacency_from_distance(distance_matrix, max_distance=np.inf, max_nei
     if not self_loops:
         graph_adjacency[..., inddiag, inddiag] = False
 
-    graph_indices = graph_indices[graph_adjacency]
+    # Index tuples of all True entries; equal to masking a pre-built index grid but without
+    # materializing the (..., N, N, ndim) index array per call.
+    graph_indices = np.argwhere(graph_adjacency)
     return graph_adjacency, graph_indices
 
 
@@ -313,6 +313,78 @@ class SetRange(GraphPreProcessorBase):
         return indices, dist_masked
 
 
+class SetRangeCachedTopology(GraphPreProcessorBase):
+    r"""Define range connections as in :obj:`SetRange` , but reuse the neighbor topology across graphs.
+
+    The first processed graph determines :obj:`range_indices` with the full distance-matrix search;
+    subsequent graphs with the same atomic numbers reuse the cached indices and only recompute the
+    pair distances. This is intended for trajectory datasets like :obj:`MD17Dataset` , where every
+    frame is the same molecule and the neighbor list is (approximately) invariant under the cutoff.
+    The cache lives on the processor instance, so one instance must be mapped over the whole list:
+
+    .. code-block:: python
+
+        dataset.map_list(SetRangeCachedTopology(
+            max_distance=5, max_neighbours=10000, node_coordinates="R", node_number="z", in_place=True))
+
+    Args:
+        range_indices (str): Name of range indices to set in dictionary. Default is "range_indices".
+        node_coordinates (str): Name of coordinates in dictionary. Default is "node_coordinates".
+        node_number (str): Name of atomic numbers in dictionary, used as cache key to detect a
+            change of molecule. Default is "node_number".
+        range_attributes (str): Name of range distance to set in dictionary. Default is "range_attributes".
+        max_distance (float): Maximum distance or cutoff radius for connections. Default is 4.0.
+        max_neighbours (int): Maximum number of allowed neighbours for a node. Default is 15.
+        do_invert_distance (bool): Whether to invert the distance. Default is False.
+        self_loops (bool): If also self-interactions with distance 0 should be considered. Default is False.
+        exclusive (bool): Whether both max_neighbours and max_distance must be fulfilled. Default is True.
+    """
+
+    def __init__(self, *, range_indices: str = "range_indices", node_coordinates: str = "node_coordinates",
+                 node_number: str = "node_number", range_attributes: str = "range_attributes",
+                 max_distance: float = 4.0, max_neighbours: int = 15, do_invert_distance: bool = False,
+                 self_loops: bool = False, exclusive: bool = True, name="set_range_cached", **kwargs):
+        super().__init__(name=name, **kwargs)
+        self._to_obtain.update({"node_coordinates": node_coordinates, "node_number": node_number})
+        self._silent = ["node_number"]
+        self._call_kwargs = {
+            "max_distance": max_distance, "max_neighbours": max_neighbours, "do_invert_distance": do_invert_distance,
+            "self_loops": self_loops, "exclusive": exclusive}
+        self._to_assign = [range_indices, range_attributes]
+        self._config_kwargs.update({
+            "node_coordinates": node_coordinates, "node_number": node_number, "range_indices": range_indices,
+            "range_attributes": range_attributes, **self._call_kwargs})
+        self._cached_key = None
+        self._cached_indices = None
+
+    def call(self, *, node_coordinates: np.ndarray, node_number: np.ndarray,
+             max_distance: float, max_neighbours: int, do_invert_distance: bool,
+             self_loops: bool, exclusive: bool):
+        if node_coordinates is None:
+            return None, None
+        # Cache key distinguishes molecules; fall back to atom count if atomic numbers are missing.
+        key = node_number.tobytes() if node_number is not None else len(node_coordinates)
+        if self._cached_indices is not None and self._cached_key == key:
+            indices = self._cached_indices
+            dist = distance_for_range_indices(coordinates=node_coordinates, indices=indices)
+            if do_invert_distance:
+                dist = invert_distance(dist)
+            return indices, dist
+        # First frame of this molecule: full neighbor search as in `SetRange` .
+        dist = coordinates_to_distancematrix(node_coordinates)
+        cons, indices = define_adjacency_from_distance(
+            dist, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive, self_loops=self_loops)
+        mask = np.array(cons, dtype="bool")
+        dist_masked = dist[mask]
+        if do_invert_distance:
+            dist_masked = invert_distance(dist_masked)
+        if len(dist_masked.shape) <= 1:
+            dist_masked = np.expand_dims(dist_masked, axis=-1)
+        self._cached_key = key
+        self._cached_indices = indices
+        return indices, dist_masked
+
+
 class SetAngle(GraphPreProcessorBase):
     r"""Find possible angles between geometric range connections defined by :obj:`range_indices`.
     Which edges form angles is stored in :obj:`angle_indices`.
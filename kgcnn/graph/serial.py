@@ -24,6 +24,7 @@ def get_preprocessor(name: Union[str, dict], **kwargs):
         "normalize_edge_weights_sym": "NormalizeEdgeWeightsSymmetric",
         "set_range_from_edges": "SetRangeFromEdges",
         "set_range": "SetRange",
+        "set_range_cached": "SetRangeCachedTopology",
         "set_angle": "SetAngle",
         "set_range_periodic": "SetRangePeriodic",
         "expand_distance_gaussian_basis": "ExpandDistanceGaussianBasis",
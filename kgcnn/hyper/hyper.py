@@ -146,10 +146,20 @@ class HyperParameter:
         hyper_compile = deepcopy(self._hyper["training"]["compile"]) if "compile" in self._hyper["training"] else {}
         if len(hyper_compile) == 0:
             module_logger.warning("Found no information for `compile` in hyperparameter.")
-        reserved_compile_arguments = ["loss", "optimizer", "weighted_metrics", "metrics"]
+        reserved_compile_arguments = ["loss", "optimizer", "weighted_metrics", "metrics", "mixed_precision"]
         hyper_compile_additional = {
             key: value for key, value in hyper_compile.items() if key not in reserved_compile_arguments}
 
+        # Optional global dtype policy, e.g. "mixed_bfloat16" to halve the bandwidth of the large
+        # dense kernels for inference. Not a keras compile kwarg, so it is consumed here.
+        if hyper_compile.get("mixed_precision", None) is not None:
+            ks.mixed_precision.set_global_policy(hyper_compile["mixed_precision"])
+
+        # With XLA jit compilation requested, turn off grappler's remapper fusions, since pre-fused
+        # ops prevent XLA auto-clustering from forming larger clusters with its own fusion passes.
+        if hyper_compile.get("jit_compile", False):
+            tf.config.optimizer.set_experimental_options({"remapping": False})
+
         def nested_deserialize(m, get):
             """Deserialize nested list or dict objects for keras model output like loss or metrics."""
             if isinstance(m, (list, tuple)):
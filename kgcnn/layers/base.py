@@ -14,6 +14,10 @@ class GraphBaseLayer(ks.layers.Layer):
 
     """
 
+    # Class-level default, so plain layer instances do not allocate an empty dict each.
+    # Subclasses overwrite this with an instance attribute and must not mutate the default.
+    _add_layer_config_to_self = {}
+
     def __init__(self,
                  ragged_validate: bool = False,
                  **kwargs):
@@ -25,7 +29,6 @@ class GraphBaseLayer(ks.layers.Layer):
         super(GraphBaseLayer, self).__init__(**kwargs)
         self.ragged_validate = ragged_validate
         self._supports_ragged_inputs = True
-        self._add_layer_config_to_self = {}
 
     def get_config(self):
         """Update layer config."""
@@ -65,7 +68,9 @@ class GraphBaseLayer(ks.layers.Layer):
 
         def validate_or_cast(x):
             if isinstance(x, tf.RaggedTensor):
-                if ragged_rank is not None:
+                # Checking the ragged rank on every call adds python dispatch overhead in eager mode.
+                # Since partitions are fixed per model, only verify if validation is requested.
+                if ragged_rank is not None and self.ragged_validate:
                     assert x.ragged_rank == ragged_rank, "'%s' must have input with ragged_rank=%s." % (
                         self.name, ragged_rank)
                 return x
@@ -77,9 +82,11 @@ class GraphBaseLayer(ks.layers.Layer):
                 if x.shape.rank <= ragged_rank:
                     raise ValueError(
                         "Rank of inputs must be > ragged_rank but found '%s <= %s' " % (x.shape.rank, ragged_rank))
-                return tf.RaggedTensor.from_row_lengths(
-                    tf.reshape(x, shape=tf.concat([tf.shape(x)[:1]*tf.shape(x)[1:2], tf.shape(x)[2:]], axis=0)),
-                    tf.repeat(tf.shape(x)[1], tf.shape(x)[0]))
+                # Uniform row length avoids materializing a row-lengths vector of batch size.
+                x_shape = tf.shape(x)
+                return tf.RaggedTensor.from_uniform_row_length(
+                    tf.reshape(x, shape=tf.concat([[-1], x_shape[2:]], axis=0)), x_shape[1],
+                    validate=self.ragged_validate)
             else:
                 raise ValueError("Unsupported tensor type '%s' in '%s'." % (type(x), self.name))
 
@@ -118,29 +125,36 @@ class GraphBaseLayer(ks.layers.Layer):
                 if all([x > 1 for x in axis]):
                     axis_values = [x - 1 for x in axis]
             if axis_values is not None:
-                kwargs_values = {key: value for key, value in kwargs.items()}
-                kwargs_values.pop("axis")
-                kwargs_values.update({"axis": axis_values})
+                kwargs_values = dict(kwargs)
+                kwargs_values["axis"] = axis_values
         else:
-            kwargs_values = {key: value for key, value in kwargs.items()}
+            # No axis to adapt. The kwargs dict is local to this call and can be passed on directly.
+            kwargs_values = kwargs
 
         if isinstance(inputs, list) and kwargs_values is not None:
             if all([isinstance(x, tf.RaggedTensor) for x in inputs]):
-                if all([x.ragged_rank == 1 for x in inputs]) and not self.ragged_validate:
+                # The lazy operation on values is safe without validation if splits are literally the
+                # same tensor object, e.g. after previous lazy layers reused the splits of one input.
+                if all([x.ragged_rank == 1 for x in inputs]) and (not self.ragged_validate or all(
+                        [x.row_splits is inputs[0].row_splits for x in inputs[1:]])):
                     out = fun([x.values for x in inputs], **kwargs_values)
+                    # Read the row splits once and share the same tensor for all outputs, so that
+                    # subsequent lazy layers can rely on identical partition tensors.
+                    row_splits = inputs[0].row_splits
                     if isinstance(out, list):
-                        return [tf.RaggedTensor.from_row_splits(x, inputs[i].row_splits, validate=self.ragged_validate)
-                                for i, x in enumerate(out)]
+                        return [tf.RaggedTensor.from_row_splits(x, row_splits, validate=self.ragged_validate)
+                                for x in out]
                     else:
-                        return tf.RaggedTensor.from_row_splits(out, inputs[0].row_splits, validate=self.ragged_validate)
+                        return tf.RaggedTensor.from_row_splits(out, row_splits, validate=self.ragged_validate)
         elif isinstance(inputs, tf.RaggedTensor) and kwargs_values is not None:
             if inputs.ragged_rank == 1:
                 out = fun(inputs.values, **kwargs_values)
+                row_splits = inputs.row_splits
                 if isinstance(out, list):
-                    return [tf.RaggedTensor.from_row_splits(x, inputs.row_splits, validate=self.ragged_validate) for x
+                    return [tf.RaggedTensor.from_row_splits(x, row_splits, validate=self.ragged_validate) for x
                             in out]
                 else:
-                    return tf.RaggedTensor.from_row_splits(out, inputs.row_splits, validate=self.ragged_validate)
+                    return tf.RaggedTensor.from_row_splits(out, row_splits, validate=self.ragged_validate)
 
         if isinstance(inputs, tf.RaggedTensor):
             print("WARNING: Layer %s fail call on value Tensor of ragged Tensor." % self.name)
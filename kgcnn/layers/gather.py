@@ -215,7 +215,13 @@ class GatherEmbeddingSelection(GraphBaseLayer):
                                                    partition_type_index="row_length",
                                                    to_indexing='batch',
                                                    from_indexing=self.node_indexing)
-                out = [tf.gather(node, tf.gather(indexlist, i, axis=1), axis=0) for i in self.selection_index]
+                if edge_index.shape[1] is not None:
+                    # Split the interleaved (M, k) index buffer once into contiguous per-column
+                    # tensors, instead of a strided slice per selection index.
+                    index_columns = tf.unstack(indexlist, num=int(edge_index.shape[1]), axis=1)
+                    out = [tf.gather(node, index_columns[i], axis=0) for i in self.selection_index]
+                else:
+                    out = [tf.gather(node, tf.gather(indexlist, i, axis=1), axis=0) for i in self.selection_index]
                 out = [tf.RaggedTensor.from_row_lengths(x, edge_part, validate=self.ragged_validate) for x in out]
                 return out
 
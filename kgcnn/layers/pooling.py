@@ -211,17 +211,26 @@ class PoolingEmbedding(GraphBaseLayer):
     r"""Polling all embeddings of edges or nodes per batch to obtain a graph level embedding in form of a
     :obj:`tf.Tensor` .
 
+    If all graphs in the batch are known to have the same number of items, e.g. trajectory frames of a
+    single molecule, :obj:`static_size` can be set to that number. Sum and mean pooling then run as a
+    plain contiguous reduction over a reshaped dense block instead of a segment operation.
+
     """
 
-    def __init__(self, pooling_method: str = "mean", **kwargs):
+    def __init__(self, pooling_method: str = "mean", static_size: int = None, **kwargs):
         """Initialize layer.
 
         Args:
             pooling_method (str): Pooling method to use i.e. segment_function. Default is 'mean'.
+            static_size (int): Fixed number of items per graph for all graphs in the batch, to pool
+                with a dense reduction instead of a segment operation. Default is None.
         """
         super(PoolingEmbedding, self).__init__(**kwargs)
         self.pooling_method = pooling_method
+        self.static_size = static_size
         self.node_indexing = "sample"
+        self._static_reduce = {"sum": tf.math.reduce_sum, "segment_sum": tf.math.reduce_sum,
+                               "mean": tf.math.reduce_mean, "segment_mean": tf.math.reduce_mean}
 
     def build(self, input_shape):
         """Build layer."""
@@ -239,16 +248,23 @@ class PoolingEmbedding(GraphBaseLayer):
         # Need ragged input but can be generalized in the future.
         self.assert_ragged_input_rank(inputs)
         # We cast to values here
-        nod, batchi = inputs.values, inputs.value_rowids()
+        nod = inputs.values
+
+        if self.static_size is not None and self.pooling_method in self._static_reduce:
+            # Equal-sized graphs reduce over a dense (batch, static_size, F) block, which avoids
+            # the scatter of a segment operation and fuses as a plain row-major reduction.
+            out = self._static_reduce[self.pooling_method](
+                tf.reshape(nod, [-1, self.static_size] + nod.shape.as_list()[1:]), axis=1)
+            return out
 
         # Could also use reduce_sum here.
-        out = segment_ops_by_name(self.pooling_method, nod, batchi)
+        out = segment_ops_by_name(self.pooling_method, nod, inputs.value_rowids())
         return out
 
     def get_config(self):
         """Update layer config."""
         config = super(PoolingEmbedding, self).get_config()
-        config.update({"pooling_method": self.pooling_method})
+        config.update({"pooling_method": self.pooling_method, "static_size": self.static_size})
         return config
 
 
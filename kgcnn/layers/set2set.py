@@ -163,6 +163,7 @@ class PoolingSet2SetEncoder(GraphBaseLayer):
         """Build layer."""
         super(PoolingSet2SetEncoder, self).build(input_shape)
 
+    @tf.function(reduce_retracing=True)
     def call(self, inputs, **kwargs):
         """Forward pass.
 
@@ -170,7 +171,7 @@ class PoolingSet2SetEncoder(GraphBaseLayer):
             inputs: nodes
 
                 - nodes (tf.RaggedTensor): Embeddings to be encoded of shape (batch, [N], F)
-        
+
         Returns:
             tf.Tensor: Pooled tensor q_star of shape (batch, 1, 2*channels)
         """
@@ -183,7 +184,8 @@ class PoolingSet2SetEncoder(GraphBaseLayer):
         # Initialize q0 and r0
         qstar = self.qstar0(m, batch_index, batch_num)
 
-        # start loop
+        # Static iteration count, so tracing unrolls the loop into one graph and the T LSTM plus
+        # attention steps run without per-iteration python dispatch.
         for i in range(0, self.T):
             q = self.lay_lstm(qstar)  # (batch,feat)
             qt = tf.repeat(q, batch_num, axis=0)  # (batch*num,feat)
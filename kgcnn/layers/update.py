@@ -76,6 +76,7 @@ class GRUUpdate(GraphBaseLayer):
         """Build layer."""
         super(GRUUpdate, self).build(input_shape)
 
+    @tf.function(reduce_retracing=True)
     def call(self, inputs, mask=None, **kwargs):
         """Forward pass.
 
@@ -91,7 +92,8 @@ class GRUUpdate(GraphBaseLayer):
         """
         inputs = self.assert_ragged_input_rank(inputs, ragged_rank=1, mask=mask)
         n, npart = inputs[0].values, inputs[0].row_splits
-        eu, _ = inputs[1].values, inputs[1].row_splits
+        # Updates match the node partition, so only the values are needed here.
+        eu = inputs[1].values
         out, _ = self.gru_cell(eu, n, **kwargs)
         out = tf.RaggedTensor.from_row_splits(out, npart, validate=self.ragged_validate)
         return out
@@ -7,7 +7,7 @@ from kgcnn.layers.gather import GatherNodesSelection
 from kgcnn.layers.geom import NodeDistanceEuclidean, NodePosition
 from kgcnn.layers.pooling import RelationalPoolingLocalEdges
 # from kgcnn.layers.pooling import PoolingLocalEdges
-from kgcnn.layers.modules import LazyMultiply, LazySubtract
+from kgcnn.layers.modules import LazySubtract
 # from kgcnn.layers.modules import ExpandDims
 
 ks = tf.keras
@@ -60,6 +60,7 @@ class ACSFG2(GraphBaseLayer):
                  add_eps: bool = False,
                  param_constraint=None, param_regularizer=None, param_initializer="zeros",
                  param_trainable: bool = False,
+                 table_dtype: str = None,
                  **kwargs):
         r"""Initialize layer.
 
@@ -78,6 +79,9 @@ class ACSFG2(GraphBaseLayer):
             param_regularizer: Parameter regularizer for weights. Default is None.
             param_initializer: Parameter initializer for weights. Default is "zeros".
             param_trainable (bool): Parameter make trainable. Default is False.
+            table_dtype (str): Storage dtype for the parameter table, e.g. "float16" to halve the
+                bandwidth of the per-bond parameter gather. Values are cast back to the compute
+                dtype inside the fused kernel. Default is None, which uses the layer dtype.
         """
         super(ACSFG2, self).__init__(**kwargs)
         # eta_rs_rc of shape (N, N, m, 3) with m combinations of eta, rs, rc
@@ -87,13 +91,15 @@ class ACSFG2(GraphBaseLayer):
         self.use_target_set = (len(self.eta_rs_rc.shape) == 4)
         self.num_relations = self.eta_rs_rc.shape[1] if self.use_target_set else self.eta_rs_rc.shape[0]
         self.element_mapping = np.array(element_mapping, dtype="int")  # of shape (N, ) with atomic number for eta_rs_rc
-        self.reverse_mapping = np.empty(self._max_atomic_number, dtype="int")
-        self.reverse_mapping.fill(np.iinfo(self.reverse_mapping.dtype).max)
-        for i, pos in enumerate(self.element_mapping):
-            self.reverse_mapping[pos] = i
+        # Hash table keyed by the actual atomic numbers instead of a dense lookup weight over all
+        # possible atomic numbers. Missing elements map to an invalid index as before.
+        self.reverse_mapping_table = tf.lookup.StaticHashTable(
+            tf.lookup.KeyValueTensorInitializer(
+                tf.constant(self.element_mapping, dtype="int64"),
+                tf.range(len(self.element_mapping), dtype="int64")),
+            default_value=np.iinfo(np.int64).max)
         self.add_eps = add_eps
 
-        self.lazy_mult = LazyMultiply()
         self.layer_pos = NodePosition()
         self.layer_gather = GatherNodesSelection([0, 1])
         self.layer_dist = NodeDistanceEuclidean(add_eps=add_eps)
@@ -104,6 +110,7 @@ class ACSFG2(GraphBaseLayer):
         self.param_regularizer = ks.regularizers.deserialize(param_regularizer)
         self.param_constraint = ks.constraints.deserialize(param_constraint)
         self.param_trainable = param_trainable
+        self.table_dtype = table_dtype
 
         self.weight_eta_rs_rc = self.add_weight(
             "eta_rs_rc",
@@ -111,18 +118,9 @@ class ACSFG2(GraphBaseLayer):
             initializer=self.param_initializer,
             regularizer=self.param_regularizer,
             constraint=self.param_constraint,
-            dtype=self.dtype, trainable=self.param_trainable
+            dtype=table_dtype if table_dtype is not None else self.dtype, trainable=self.param_trainable
         )
-        self.weight_reverse_mapping = self.add_weight(
-            "reverse_mapping",
-            shape=(self._max_atomic_number,),
-            initializer=self.param_initializer,
-            regularizer=self.param_regularizer,
-            constraint=self.param_constraint,
-            dtype="int64", trainable=False
-        )
-
-        self.set_weights([self.eta_rs_rc, self.reverse_mapping])
+        self.set_weights([self.eta_rs_rc])
 
     @staticmethod
     def make_param_table(eta: list, rs: list, rc: float, elements: list, **kwargs):
@@ -144,43 +142,48 @@ class ACSFG2(GraphBaseLayer):
         return {"eta_rs_rc": params, "element_mapping": elements, **kwargs}
 
     def _find_atomic_number_maps(self, inputs):
-        return tf.gather(self.weight_reverse_mapping, inputs, axis=0)
+        return self.reverse_mapping_table.lookup(tf.cast(inputs, dtype="int64"))
 
     def _find_params_per_bond(self, inputs: list):
         zi_map, zj_map = inputs
         if self.use_target_set:
-            params = tf.gather(tf.gather(self.weight_eta_rs_rc, zi_map, axis=0), zj_map, axis=1, batch_dims=1)
+            # Single gather with a linear index into the flattened (N*N, m, 3) table instead of a
+            # chained gather with batch_dims, which materializes an (edges, N, m, 3) intermediate.
+            table_shape = self.eta_rs_rc.shape
+            flat_table = tf.reshape(self.weight_eta_rs_rc, (table_shape[0] * table_shape[1],) + table_shape[2:])
+            params = tf.gather(flat_table, zi_map * table_shape[1] + zj_map, axis=0)
         else:
             # Atomic specific for j but not i.
             params = tf.gather(self.weight_eta_rs_rc, zj_map, axis=0)
         return params
 
-    @staticmethod
-    def _compute_fc(inputs: tf.Tensor):
+    @tf.function(jit_compile=True, reduce_retracing=True)
+    def _compute_gaussian_with_fc(self, inputs: tf.Tensor):
+        """Cutoff function times gaussian expansion, fused into a single XLA kernel.
+
+        XLA tiles the fused elementwise body over the edge dimension itself, so the (edges, N*m)
+        intermediates are never materialized; an explicit blocked loop over edges is not needed.
+        """
         rij, params = inputs
-        cutoff = tf.gather(params, 2, axis=-1)
-        fc = tf.clip_by_value(tf.broadcast_to(rij, tf.shape(cutoff)), -cutoff, cutoff)
+        # Upcast from a possibly reduced-precision table; a no-op cast for matching dtypes.
+        params = tf.cast(params, rij.dtype)
+        # One unstack instead of three gathers along the last axis.
+        eta, mu, cutoff = tf.unstack(params, num=3, axis=-1)
+        # Distances are positive, so clipping to [-cutoff, cutoff] reduces to a broadcast minimum.
+        fc = tf.minimum(rij, cutoff)
         fc = (tf.math.cos(fc * math.pi / cutoff) + 1.0) * 0.5
         # fc = tf.where(tf.abs(inputs) < self.cutoff, fc, tf.zeros_like(fc))
-        return fc
-
-    @staticmethod
-    def _compute_gaussian_expansion(inputs: tf.Tensor):
-        rij, params = inputs
-        eta, mu = tf.gather(params, 0, axis=-1), tf.gather(params, 1, axis=-1)
-        arg = tf.square(rij - mu) * eta
-        return tf.exp(-arg)
+        return tf.exp(-tf.square(rij - mu) * eta) * fc
 
     @staticmethod
     def _flatten_relations(inputs):
-        input_shape = tf.shape(inputs)
-        flatten_shape = tf.concat(
-            [input_shape[:1], tf.constant([inputs.shape[1] * inputs.shape[2]], dtype=input_shape.dtype)], axis=0)
-        return tf.reshape(inputs, flatten_shape)
+        # The relation axes have static size, so -1 for the leading axis avoids a tf.shape read.
+        return tf.reshape(inputs, (-1, inputs.shape[1] * inputs.shape[2]))
 
     def build(self, input_shape):
         super(ACSFG2, self).build(input_shape)
 
+    @tf.function(reduce_retracing=True)
     def call(self, inputs, mask=None, **kwargs):
         r"""Forward pass.
 
@@ -200,13 +203,12 @@ class ACSFG2(GraphBaseLayer):
         z = self.map_values(tf.cast, z, dtype=eij.dtype)
         xi, xj = self.layer_pos([xyz, eij], **kwargs)
         rij = self.layer_dist([xi, xj], **kwargs)
-        zi, zj = self.layer_gather([z, eij])
-        zi_map = self.map_values(self._find_atomic_number_maps, zi)
-        zj_map = self.map_values(self._find_atomic_number_maps, zj)
+        # Resolve atomic numbers to table indices once per node and gather per edge, rather than
+        # running the lookup on both endpoint lists.
+        z_map = self.map_values(self._find_atomic_number_maps, z)
+        zi_map, zj_map = self.layer_gather([z_map, eij])
         params_per_bond = self.map_values(self._find_params_per_bond, [zi_map, zj_map])
-        fc = self.map_values(self._compute_fc, [rij, params_per_bond])
-        gij = self.map_values(self._compute_gaussian_expansion, [rij, params_per_bond])
-        rep = self.lazy_mult([gij, fc], **kwargs)
+        rep = self.map_values(self._compute_gaussian_with_fc, [rij, params_per_bond])
         pooled = self.pool_sum([xyz, rep, eij, zj_map], **kwargs)
         return self.map_values(self._flatten_relations, pooled)
 
@@ -216,6 +218,7 @@ class ACSFG2(GraphBaseLayer):
             "eta_rs_rc": self.eta_rs_rc.tolist(),
             "element_mapping": self.element_mapping.tolist(),
             "add_eps": self.add_eps,
+            "table_dtype": self.table_dtype,
             "param_constraint": ks.constraints.serialize(self.param_constraint),
             "param_regularizer": ks.regularizers.serialize(self.param_regularizer),
             "param_initializer": ks.initializers.serialize(self.param_initializer),
@@ -270,8 +273,10 @@ class ACSFG4(GraphBaseLayer):
                  add_eps: bool = False,
                  keep_pair_order: bool = False,
                  multiplicity: float = None,
+                 include_jk_terms: bool = True,
                  param_initializer="zeros", param_regularizer=None, param_constraint=None,
                  param_trainable: bool = False,
+                 table_dtype: str = None,
                  **kwargs):
         r"""Initialize layer.
 
@@ -293,18 +298,44 @@ class ACSFG4(GraphBaseLayer):
             keep_pair_order (bool): Whether to have parameters for order atom pairs that make an angle.
                 Default is False.
             multiplicity (float): Angle term is divided by multiplicity, if not None. Default is None.
+            include_jk_terms (bool): Whether to include the :math:`r_{jk}` dependent factors
+                :math:`e^{-\eta r_{jk}^2} f_{jk}` . Setting this to `False` gives the cheaper
+                :math:`G^{5}` variant, which skips one distance, cutoff and gaussian evaluation
+                per angle. Default is True.
             add_eps (bool): Whether to add epsilon. Default is False.
             param_constraint: Parameter constraint for weights. Default is None.
             param_regularizer: Parameter regularizer for weights. Default is None.
             param_initializer: Parameter initializer for weights. Default is "zeros".
             param_trainable (bool): Parameter make trainable. Default is False.
+            table_dtype (str): Storage dtype for the parameter table, e.g. "float16" to halve the
+                bandwidth of the per-angle parameter gather. Values are cast back to the compute
+                dtype in the symmetry function terms. Default is None, which uses the layer dtype.
         """
         super(ACSFG4, self).__init__(**kwargs)
         self.add_eps = add_eps
         self.multiplicity = multiplicity
+        # Constant reciprocal to replace the per-call division by multiplicity.
+        self._inv_multiplicity = 1.0 / multiplicity if multiplicity is not None else None
+        self.include_jk_terms = include_jk_terms
         self.keep_pair_order = keep_pair_order
         self.eta_zeta_lambda_rc = np.array(eta_zeta_lambda_rc, dtype="float")
         assert len(self.eta_zeta_lambda_rc.shape) in [3, 4], "Require `eta_zeta_lambda_rc` rank 3 or 4."
+        # If all zeta in the (non-trainable) table are one integer, the angle power can be done by
+        # repeated squaring instead of a generic pow.
+        zeta_table = self.eta_zeta_lambda_rc[..., 1]
+        if not param_trainable and np.all(zeta_table == zeta_table.flat[0]) and float(
+                zeta_table.flat[0]).is_integer() and zeta_table.flat[0] >= 0:
+            self._static_zeta = int(zeta_table.flat[0])
+        else:
+            self._static_zeta = None
+        # Likewise a single non-trainable lambda of -1 or +1 turns the lambda multiply into a
+        # static sign on cos(theta).
+        lambda_table = self.eta_zeta_lambda_rc[..., 2]
+        if not param_trainable and np.all(lambda_table == lambda_table.flat[0]) and abs(
+                lambda_table.flat[0]) == 1.0:
+            self._static_lambda = float(lambda_table.flat[0])
+        else:
+            self._static_lambda = None
         self.use_target_set = (len(self.eta_zeta_lambda_rc.shape) == 4)
         if self.use_target_set:
             self.num_relations = self.eta_zeta_lambda_rc.shape[1]
@@ -327,25 +358,32 @@ class ACSFG4(GraphBaseLayer):
         assert len(self.element_pair_mapping.shape) == 2 and self.element_pair_mapping.shape[1] == 2
         assert self.element_pair_mapping.shape[0] == self.num_relations
 
-        self.reverse_mapping = np.empty(self._max_atomic_number, dtype="int")
-        self.reverse_mapping.fill(np.iinfo(self.reverse_mapping.dtype).max)
-        for i, pos in enumerate(self.element_mapping):
-            self.reverse_mapping[pos] = i
-
-        self.reverse_pair_mapping = np.empty((self._max_atomic_number, self._max_atomic_number), dtype="int")
-        self.reverse_pair_mapping.fill(np.iinfo(self.reverse_pair_mapping.dtype).max)
+        # Hash tables keyed by the actual atomic numbers and pairs instead of dense lookup weights
+        # over all possible atomic numbers. Missing entries map to an invalid index as before.
+        self.reverse_mapping_table = tf.lookup.StaticHashTable(
+            tf.lookup.KeyValueTensorInitializer(
+                tf.constant(self.element_mapping, dtype="int64"),
+                tf.range(len(self.element_mapping), dtype="int64")),
+            default_value=np.iinfo(np.int64).max)
+        # Pairs are encoded into a single int64 key as zj * max_atomic_number + zk.
+        pair_key_map = {}
         for i, pos in enumerate(self.element_pair_mapping):
-            self.reverse_pair_mapping[pos[0], pos[1]] = i
+            pair_key_map[int(pos[0]) * self._max_atomic_number + int(pos[1])] = i
             if not self.keep_pair_order:
-                self.reverse_pair_mapping[pos[1], pos[0]] = i
+                pair_key_map[int(pos[1]) * self._max_atomic_number + int(pos[0])] = i
+        self.reverse_pair_mapping_table = tf.lookup.StaticHashTable(
+            tf.lookup.KeyValueTensorInitializer(
+                tf.constant(list(pair_key_map.keys()), dtype="int64"),
+                tf.constant(list(pair_key_map.values()), dtype="int64")),
+            default_value=np.iinfo(np.int64).max)
 
         # Sub-layer.
-        self.lazy_mult = LazyMultiply()
         self.layer_pos = NodePosition(selection_index=[0, 1, 2])
         self.layer_dist = NodeDistanceEuclidean(add_eps=add_eps)
         self.pool_sum = RelationalPoolingLocalEdges(num_relations=self.num_relations, pooling_method="sum")
         self.lazy_sub = LazySubtract()
-        self.layer_gather = GatherNodesSelection(selection_index=[0, 1, 2])
+        self.layer_gather_center = GatherNodesSelection(selection_index=[0])
+        self.layer_gather_pair = GatherNodesSelection(selection_index=[1, 2])
 
         # We can do this in init since weights do not depend on input shape.
         self.param_initializer = ks.initializers.deserialize(param_initializer)
@@ -353,31 +391,16 @@ class ACSFG4(GraphBaseLayer):
         self.param_constraint = ks.constraints.deserialize(param_constraint)
         self.param_trainable = param_trainable
 
+        self.table_dtype = table_dtype
         self.weight_eta_zeta_lambda_rc = self.add_weight(
             "eta_zeta_lambda_rc",
             shape=self.eta_zeta_lambda_rc.shape,
             initializer=self.param_initializer,
             regularizer=self.param_regularizer,
             constraint=self.param_constraint,
-            dtype=self.dtype, trainable=self.param_trainable
-        )
-        self.weight_reverse_mapping = self.add_weight(
-            "reverse_mapping",
-            shape=(self._max_atomic_number,),
-            initializer=self.param_initializer,
-            regularizer=self.param_regularizer,
-            constraint=self.param_constraint,
-            dtype="int64", trainable=False
+            dtype=table_dtype if table_dtype is not None else self.dtype, trainable=self.param_trainable
         )
-        self.weight_reverse_pair_mapping = self.add_weight(
-            "reverse_pair_mapping",
-            shape=(self._max_atomic_number, self._max_atomic_number),
-            initializer=self.param_initializer,
-            regularizer=self.param_regularizer,
-            constraint=self.param_constraint,
-            dtype="int64", trainable=False
-        )
-        self.set_weights([self.eta_zeta_lambda_rc, self.reverse_mapping, self.reverse_pair_mapping])
+        self.set_weights([self.eta_zeta_lambda_rc])
 
     @staticmethod
     def make_param_table(eta: list, zeta: list, lamda: list, rc: float, elements: list, **kwargs):
@@ -401,60 +424,92 @@ class ACSFG4(GraphBaseLayer):
         return {"eta_zeta_lambda_rc": params, "element_mapping": elements, "element_pair_mapping": None, **kwargs}
 
     def _find_atomic_number_maps(self, inputs):
-        return tf.gather(self.weight_reverse_mapping, inputs, axis=0)
+        return self.reverse_mapping_table.lookup(tf.cast(inputs, dtype="int64"))
 
     def _find_atomic_number_pair_maps(self, inputs):
         zj, zk = inputs
-        return tf.gather(tf.gather(self.weight_reverse_pair_mapping, zj, axis=0), zk, axis=1, batch_dims=1)
+        pair_key = tf.cast(zj, dtype="int64") * self._max_atomic_number + tf.cast(zk, dtype="int64")
+        return self.reverse_pair_mapping_table.lookup(pair_key)
 
     def _find_params_per_bond(self, inputs: list):
         zi_map, zjk_map = inputs
         if self.use_target_set:
-            params = tf.gather(tf.gather(self.weight_eta_zeta_lambda_rc, zi_map, axis=0), zjk_map, axis=1, batch_dims=1)
+            # Single gather with a linear index into the flattened (N*M, m, 4) table instead of a
+            # chained gather with batch_dims, which materializes an (angles, M, m, 4) intermediate.
+            table_shape = self.eta_zeta_lambda_rc.shape
+            flat_table = tf.reshape(
+                self.weight_eta_zeta_lambda_rc, (table_shape[0] * table_shape[1],) + table_shape[2:])
+            params = tf.gather(flat_table, zi_map * table_shape[1] + zjk_map, axis=0)
         else:
             # Atomic specific for j,k but not i.
             params = tf.gather(self.weight_eta_zeta_lambda_rc, zjk_map, axis=0)
         return params
 
     @staticmethod
-    def _compute_fc(inputs: tf.Tensor):
-        rij, params = inputs
-        cutoff = tf.gather(params, 3, axis=-1)
-        fc = tf.clip_by_value(tf.broadcast_to(rij, tf.shape(cutoff)), -cutoff, cutoff)
-        fc = (tf.math.cos(fc * np.pi / cutoff) + 1.0) * 0.5
-        # fc = tf.where(tf.abs(inputs) < self.cutoff, fc, tf.zeros_like(fc))
-        return fc
-
-    @staticmethod
-    def _compute_gaussian_expansion(inputs: tf.Tensor):
-        rij, params = inputs
-        eta = tf.gather(params, 0, axis=-1)
-        # mu = tf.gather(params, 1, axis=-1)
-        arg = tf.square(rij) * eta
-        return tf.exp(-arg)
-
-    def _compute_pow_cos_angle_(self, inputs: list):
-        vij, vik, rij, rik, params = inputs
-        lamda, zeta = tf.gather(params, 2, axis=-1), tf.gather(params, 1, axis=-1)
-        cos_theta = tf.reduce_sum(vij * vik, axis=-1, keepdims=True) / rij / rik
-        cos_term = cos_theta * lamda + 1.0
-        cos_term = tf.pow(cos_term, zeta)
-        scale = tf.ones_like(cos_term) * 2.0
-        scaled_cos_term = tf.pow(scale, 1.0 - zeta) * cos_term
+    def _integer_power(x: tf.Tensor, n: int):
+        """Exponentiation by squaring for a static non-negative integer exponent."""
+        result, base = None, x
+        while n > 0:
+            if n & 1:
+                result = base if result is None else result * base
+            n >>= 1
+            if n > 0:
+                base = base * base
+        return result if result is not None else tf.ones_like(x)
+
+    @tf.function(jit_compile=True, reduce_retracing=True)
+    def _compute_angular_representation(self, inputs: list):
+        """Full angular symmetry-function term fused into a single XLA kernel.
+
+        Combines the angle power, the gaussian expansions and the cutoff functions, so the
+        per-factor (angles, M*m) intermediates of a chained lazy multiply are never materialized.
+        """
+        if self.include_jk_terms:
+            vij, vik, rij, rik, rjk, params = inputs
+        else:
+            vij, vik, rij, rik, params = inputs
+            rjk = None
+        # Upcast from a possibly reduced-precision table; a no-op cast for matching dtypes.
+        params = tf.cast(params, rij.dtype)
+        # One unstack instead of separate gathers along the last axis.
+        eta, zeta, lamda, cutoff = tf.unstack(params, num=4, axis=-1)
+        cos_theta = tf.reduce_sum(vij * vik, axis=-1, keepdims=True) / (rij * rik)
+        if self._static_lambda is not None:
+            cos_term = 1.0 + cos_theta if self._static_lambda > 0 else 1.0 - cos_theta
+        else:
+            cos_term = cos_theta * lamda + 1.0
+        if self._static_zeta is not None:
+            cos_term = self._integer_power(cos_term, self._static_zeta)
+            scaled_cos_term = (2.0 ** (1.0 - self._static_zeta)) * cos_term
+        else:
+            cos_term = tf.pow(cos_term, zeta)
+            # The prefactor 2^(1-zeta) as exp instead of broadcasting a constant-two tensor into pow.
+            scaled_cos_term = tf.exp(math.log(2.0) * (1.0 - zeta)) * cos_term
         if self.multiplicity is not None:
-            scaled_cos_term = scaled_cos_term/self.multiplicity
-        return scaled_cos_term
+            scaled_cos_term = scaled_cos_term * self._inv_multiplicity
+
+        def fc(r):
+            # Distances are positive, so clipping to [-cutoff, cutoff] reduces to a broadcast minimum.
+            r_cut = tf.minimum(r, cutoff)
+            return (tf.math.cos(r_cut * math.pi / cutoff) + 1.0) * 0.5
+
+        # Gaussians of all distances share eta and merge into a single exponential.
+        arg = tf.square(rij) + tf.square(rik)
+        fc_prod = fc(rij) * fc(rik)
+        if rjk is not None:
+            arg = arg + tf.square(rjk)
+            fc_prod = fc_prod * fc(rjk)
+        return scaled_cos_term * tf.exp(-arg * eta) * fc_prod
 
     @staticmethod
     def _flatten_relations(inputs):
-        input_shape = tf.shape(inputs)
-        flatten_shape = tf.concat(
-            [input_shape[:1], tf.constant([inputs.shape[1] * inputs.shape[2]], dtype=input_shape.dtype)], axis=0)
-        return tf.reshape(inputs, flatten_shape)
+        # The relation axes have static size, so -1 for the leading axis avoids a tf.shape read.
+        return tf.reshape(inputs, (-1, inputs.shape[1] * inputs.shape[2]))
 
     def build(self, input_shape):
         super(ACSFG4, self).build(input_shape)
 
+    @tf.function(reduce_retracing=True)
     def call(self, inputs, mask=None, **kwargs):
         r"""Forward pass.
 
@@ -472,36 +527,39 @@ class ACSFG4(GraphBaseLayer):
         """
         z, xyz, ijk = self.assert_ragged_input_rank(inputs, mask=mask, ragged_rank=1)
         z = self.map_values(tf.cast, z, dtype=ijk.dtype)
-        zi, zj, zk = self.layer_gather([z, ijk], **kwargs)
         xi, xj, xk = self.layer_pos([xyz, ijk], **kwargs)
-        zi_map = self.map_values(self._find_atomic_number_maps, zi)
+        # Resolve atomic numbers to table indices once per node, then gather the center index per
+        # angle; only the pair lookup still runs on the angle lists.
+        z_map = self.map_values(self._find_atomic_number_maps, z)
+        zi_map, = self.layer_gather_center([z_map, ijk], **kwargs)
+        zj, zk = self.layer_gather_pair([z, ijk], **kwargs)
         zjk_map = self.map_values(self._find_atomic_number_pair_maps, [zj, zk])
         params_per_bond = self.map_values(self._find_params_per_bond, [zi_map, zjk_map])
         rij = self.layer_dist([xi, xj], **kwargs)
         rik = self.layer_dist([xi, xk], **kwargs)
-        rjk = self.layer_dist([xj, xk], **kwargs)
-        fij = self.map_values(self._compute_fc, [rij, params_per_bond])
-        fik = self.map_values(self._compute_fc, [rik, params_per_bond])
-        fjk = self.map_values(self._compute_fc, [rjk, params_per_bond])
-        gij = self.map_values(self._compute_gaussian_expansion, [rij, params_per_bond])
-        gik = self.map_values(self._compute_gaussian_expansion, [rik, params_per_bond])
-        gjk = self.map_values(self._compute_gaussian_expansion, [rjk, params_per_bond])
         vij = self.lazy_sub([xi, xj], **kwargs)
         vik = self.lazy_sub([xi, xk], **kwargs)
-        pow_cos_theta = self.map_values(self._compute_pow_cos_angle_, [vij, vik, rij, rik, params_per_bond])
-        rep = self.lazy_mult([pow_cos_theta, gij, gik, gjk, fij, fik, fjk], **kwargs)
+        if self.include_jk_terms:
+            rjk = self.layer_dist([xj, xk], **kwargs)
+            rep = self.map_values(
+                self._compute_angular_representation, [vij, vik, rij, rik, rjk, params_per_bond])
+        else:
+            rep = self.map_values(
+                self._compute_angular_representation, [vij, vik, rij, rik, params_per_bond])
         pool_ang = self.pool_sum([xyz, rep, ijk, zjk_map], **kwargs)
         return self.map_values(self._flatten_relations, pool_ang)
 
     def get_config(self):
         config = super(ACSFG4, self).get_config()
         config.update({
-            "eta_zeta_lambda_rc": self.eta_zeta_lambda_rc,
+            "eta_zeta_lambda_rc": self.eta_zeta_lambda_rc.tolist(),
             "add_eps": self.add_eps,
-            "element_mapping": self.element_mapping,
+            "element_mapping": self.element_mapping.tolist(),
             "keep_pair_order": self.keep_pair_order,
             "multiplicity": self.multiplicity,
-            "element_pair_mapping": self.element_pair_mapping,
+            "include_jk_terms": self.include_jk_terms,
+            "table_dtype": self.table_dtype,
+            "element_pair_mapping": self.element_pair_mapping.tolist(),
             "param_trainable": self.param_trainable,
             "param_constraint": ks.constraints.serialize(self.param_constraint),
             "param_regularizer": ks.regularizers.serialize(self.param_regularizer),
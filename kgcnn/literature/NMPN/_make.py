@@ -1,8 +1,7 @@
 import tensorflow as tf
 from kgcnn.layers.casting import ChangeTensorType
-from ._mpnn_conv import TrafoEdgeNetMessages, MatMulMessages
+from ._mpnn_conv import TrafoEdgeNetMessages, GatherTrafoMessages
 from kgcnn.layers.update import GRUUpdate
-from kgcnn.layers.gather import GatherNodesOutgoing, GatherNodesIngoing
 from kgcnn.layers.modules import Dense, LazyConcatenate, OptionalInputEmbedding
 from kgcnn.layers.mlp import GraphMLP, MLP
 from kgcnn.layers.pooling import PoolingLocalEdges, PoolingNodes
@@ -36,6 +35,7 @@ model_default = {
     "pooling_args": {"pooling_method": "segment_sum"},
     "edge_mlp": {"use_bias": True, "activation": "swish", "units": [64, 64, 64]},
     "use_set2set": True, "depth": 3, "node_dim": 64,
+    "node_embedding_to_hidden": False,
     "verbose": 10,
     "output_embedding": 'graph', "output_to_tensor": True,
     "output_mlp": {"use_bias": [True, True, False], "units": [25, 10, 1],
@@ -55,6 +55,7 @@ def make_model(inputs: list = None,
                edge_mlp: dict = None,
                use_set2set: bool = None,
                node_dim: int = None,
+               node_embedding_to_hidden: bool = None,
                depth: int = None,
                verbose: int = None,
                name: str = None,
@@ -97,6 +98,9 @@ def make_model(inputs: list = None,
         edge_mlp (dict): Dictionary of layer arguments unpacked in :obj:`MLP` layer for edge matrix.
         use_set2set (bool): Whether to use :obj:`PoolingSet2SetEncoder` layer.
         node_dim (int): Dimension of hidden node embedding.
+        node_embedding_to_hidden (bool): Whether to let the node embedding produce :obj:`node_dim` directly
+            and skip the initial linear projection, which is equivalent to folding the projection into the
+            embedding weights. Only takes effect with an embedding layer. Default is False.
         depth (int): Number of graph embedding units or depth of the network.
         verbose (int): Level of verbosity.
         name (str): Name of the model.
@@ -109,13 +113,22 @@ def make_model(inputs: list = None,
         :obj:`tf.keras.models.Model`
     """
     # Make input
+    # Ragged inputs here only define the batch partition. All graph layers below operate lazily on
+    # the flat values in disjoint (block-diagonal) form and re-attach the same row splits, so the
+    # ragged representation does not enter the inner compute kernels.
     node_input = ks.layers.Input(**inputs[0])
     edge_input = ks.layers.Input(**inputs[1])  # Or coordinates
     edge_index_input = ks.layers.Input(**inputs[2])
     edi = edge_index_input
 
     # embedding, if no feature dimension
-    n0 = OptionalInputEmbedding(**input_embedding['node'], use_embedding=len(inputs[0]['shape']) < 2)(node_input)
+    use_node_embedding = len(inputs[0]['shape']) < 2
+    if node_embedding_to_hidden and use_node_embedding:
+        # Fold the initial linear projection into the embedding weights by emitting node_dim directly.
+        n0 = OptionalInputEmbedding(
+            **{**input_embedding['node'], 'output_dim': node_dim}, use_embedding=True)(node_input)
+    else:
+        n0 = OptionalInputEmbedding(**input_embedding['node'], use_embedding=use_node_embedding)(node_input)
     if not geometric_edge:
         ed = OptionalInputEmbedding(**input_embedding['edge'], use_embedding=len(inputs[1]['shape']) < 2)(edge_input)
     else:
@@ -130,7 +143,10 @@ def make_model(inputs: list = None,
         ed = GaussBasisLayer(**gauss_args)(ed)
 
     # Make hidden dimension
-    n = Dense(node_dim, activation="linear")(n0)
+    if node_embedding_to_hidden and use_node_embedding:
+        n = n0
+    else:
+        n = Dense(node_dim, activation="linear")(n0)
 
     # Make edge networks.
     edge_net_in = GraphMLP(**edge_mlp)(ed)
@@ -142,10 +158,9 @@ def make_model(inputs: list = None,
     gru = GRUUpdate(node_dim)
 
     for i in range(0, depth):
-        n_in = GatherNodesOutgoing()([n, edi])
-        n_out = GatherNodesIngoing()([n, edi])
-        m_in = MatMulMessages()([edge_net_in, n_in])
-        m_out = MatMulMessages()([edge_net_out, n_out])
+        # Gather and transform fused into one kernel per direction.
+        m_in = GatherTrafoMessages(selection_index=1)([n, edge_net_in, edi])
+        m_out = GatherTrafoMessages(selection_index=0)([n, edge_net_out, edi])
         eu = LazyConcatenate(axis=-1)([m_in, m_out])
         eu = PoolingLocalEdges(**pooling_args)([n, eu, edi])  # Summing for each node connections
         n = gru([n, eu])
@@ -187,6 +202,7 @@ model_crystal_default = {
     "pooling_args": {"pooling_method": "segment_sum"},
     "edge_mlp": {"use_bias": True, "activation": "swish", "units": [64, 64, 64]},
     "use_set2set": True, "depth": 3, "node_dim": 64,
+    "node_embedding_to_hidden": False,
     "verbose": 10,
     "output_embedding": 'graph', "output_to_tensor": True,
     "output_mlp": {"use_bias": [True, True, False], "units": [25, 10, 1],
@@ -206,6 +222,7 @@ def make_crystal_model(inputs: list = None,
                        edge_mlp: dict = None,
                        use_set2set: bool = None,
                        node_dim: int = None,
+                       node_embedding_to_hidden: bool = None,
                        depth: int = None,
                        verbose: int = None,
                        name: str = None,
@@ -251,6 +268,9 @@ def make_crystal_model(inputs: list = None,
         edge_mlp (dict): Dictionary of layer arguments unpacked in :obj:`MLP` layer for edge matrix.
         use_set2set (bool): Whether to use :obj:`PoolingSet2SetEncoder` layer.
         node_dim (int): Dimension of hidden node embedding.
+        node_embedding_to_hidden (bool): Whether to let the node embedding produce :obj:`node_dim` directly
+            and skip the initial linear projection, which is equivalent to folding the projection into the
+            embedding weights. Only takes effect with an embedding layer. Default is False.
         depth (int): Number of graph embedding units or depth of the network.
         verbose (int): Level of verbosity.
         name (str): Name of the model.
@@ -272,7 +292,13 @@ def make_crystal_model(inputs: list = None,
     edi = edge_index_input
 
     # embedding, if no feature dimension
-    n0 = OptionalInputEmbedding(**input_embedding['node'], use_embedding=len(inputs[0]['shape']) < 2)(node_input)
+    use_node_embedding = len(inputs[0]['shape']) < 2
+    if node_embedding_to_hidden and use_node_embedding:
+        # Fold the initial linear projection into the embedding weights by emitting node_dim directly.
+        n0 = OptionalInputEmbedding(
+            **{**input_embedding['node'], 'output_dim': node_dim}, use_embedding=True)(node_input)
+    else:
+        n0 = OptionalInputEmbedding(**input_embedding['node'], use_embedding=use_node_embedding)(node_input)
     if not geometric_edge:
         ed = OptionalInputEmbedding(**input_embedding['edge'], use_embedding=len(inputs[1]['shape']) < 2)(edge_input)
     else:
@@ -289,7 +315,10 @@ def make_crystal_model(inputs: list = None,
         ed = GaussBasisLayer(**gauss_args)(ed)
 
     # Make hidden dimension
-    n = Dense(node_dim, activation="linear")(n0)
+    if node_embedding_to_hidden and use_node_embedding:
+        n = n0
+    else:
+        n = Dense(node_dim, activation="linear")(n0)
 
     # Make edge networks.
     edge_net_in = GraphMLP(**edge_mlp)(ed)
@@ -301,10 +330,9 @@ def make_crystal_model(inputs: list = None,
     gru = GRUUpdate(node_dim)
 
     for i in range(0, depth):
-        n_in = GatherNodesOutgoing()([n, edi])
-        n_out = GatherNodesIngoing()([n, edi])
-        m_in = MatMulMessages()([edge_net_in, n_in])
-        m_out = MatMulMessages()([edge_net_out, n_out])
+        # Gather and transform fused into one kernel per direction.
+        m_in = GatherTrafoMessages(selection_index=1)([n, edge_net_in, edi])
+        m_out = GatherTrafoMessages(selection_index=0)([n, edge_net_out, edi])
         eu = LazyConcatenate(axis=-1)([m_in, m_out])
         eu = PoolingLocalEdges(**pooling_args)([n, eu, edi])  # Summing for each node connections
         n = gru([n, eu])
@@ -1,6 +1,7 @@
 import tensorflow as tf
 from kgcnn.layers.base import GraphBaseLayer
 from kgcnn.layers.modules import Dense
+from kgcnn.ops.partition import partition_row_indexing
 
 ks = tf.keras
 
@@ -47,11 +48,14 @@ class TrafoEdgeNetMessages(GraphBaseLayer):
         Returns:
             tf.RaggedTensor: Messages in matrix for multiplication of shape (batch, [M], F, F)
         """
-        self.assert_ragged_input_rank(inputs)
-        up_scale = self.lay_dense(inputs, **kwargs)
-        dens_trafo, trafo_part = up_scale.values, up_scale.row_splits
-        dens_m = tf.reshape(dens_trafo, (ks.backend.shape(dens_trafo)[0], self._units_out, self._units_in))
-        out = tf.RaggedTensor.from_row_splits(dens_m, trafo_part, validate=self.ragged_validate)
+        inputs = self.assert_ragged_input_rank(inputs)
+        # Run dense plus reshape directly on the flat values as one matmul path, instead of
+        # wrapping the dense output into a ragged tensor just to unwrap it again. The reshape of
+        # the contiguous matmul output is metadata-only, equivalent to a fused einsum.
+        up_scale = self.lay_dense(inputs.values, **kwargs)
+        # Target matrix shape is static, so -1 for the edge axis avoids a runtime shape read.
+        dens_m = tf.reshape(up_scale, (-1, self._units_out, self._units_in))
+        out = tf.RaggedTensor.from_row_splits(dens_m, inputs.row_splits, validate=self.ragged_validate)
         return out
 
     def get_config(self):
@@ -83,6 +87,18 @@ class MatMulMessages(GraphBaseLayer):
         """Build layer."""
         super(MatMulMessages, self).build(input_shape)
 
+    @staticmethod
+    @tf.function(jit_compile=True, reduce_retracing=True)
+    def _matmul_values(dens_trafo, dens_e):
+        """Per-message matrix-vector product as a jit-compiled kernel.
+
+        The message-passing depth loop itself runs on ragged tensors, which XLA can not cluster,
+        but the per-edge transform on the flat values can be compiled and fused on its own.
+        """
+        # Explicit einsum for the per-message matrix-vector product instead of batch_dot, which
+        # expands the vector and goes through a generic batched matmul with extra reshapes.
+        return tf.einsum('mij,mj->mi', dens_trafo, dens_e)
+
     def call(self, inputs, **kwargs):
         """Forward pass. Operates on values without checking splits of the ragged dimension.
 
@@ -91,14 +107,14 @@ class MatMulMessages(GraphBaseLayer):
 
                 - trafo_mat (tf.RaggedTensor): Transformation matrix for each message of shape (batch, [M], F', F).
                 - edges (tf.RaggedTensor): Edge embeddings or messages (batch, [M], F)
-            
+
         Returns:
             tf.RaggedTensor: Transformation of messages by matrix multiplication of shape (batch, [M], F')
         """
         self.assert_ragged_input_rank(inputs)
-        dens_trafo, trafo_part = inputs[0].values, inputs[0].row_splits
+        dens_trafo = inputs[0].values
         dens_e, epart = inputs[1].values, inputs[1].row_splits
-        out = tf.keras.backend.batch_dot(dens_trafo, dens_e)
+        out = self._matmul_values(dens_trafo, dens_e)
         out = tf.RaggedTensor.from_row_splits(out, epart, validate=self.ragged_validate)
         return out
 
@@ -106,3 +122,65 @@ class MatMulMessages(GraphBaseLayer):
         """Update layer config."""
         config = super(MatMulMessages, self).get_config()
         return config
+
+
+@tf.keras.utils.register_keras_serializable(package='kgcnn', name='GatherTrafoMessages')
+class GatherTrafoMessages(GraphBaseLayer):
+    """Gather node embeddings for each edge and apply the per-edge transformation matrix in one step.
+
+    Combines :obj:`GatherNodesSelection` and :obj:`MatMulMessages` so the gathered node tensor of
+    shape `(batch, [M], F)` stays local to a single fused kernel instead of being written back
+    between two layers.
+
+    Args:
+        selection_index (int): Which edge index to gather node embeddings for. Default is 1.
+    """
+
+    def __init__(self, selection_index: int = 1, **kwargs):
+        """Initialize layer."""
+        super(GatherTrafoMessages, self).__init__(**kwargs)
+        self.selection_index = selection_index
+        self.node_indexing = "sample"
+
+    def build(self, input_shape):
+        """Build layer."""
+        super(GatherTrafoMessages, self).build(input_shape)
+
+    @staticmethod
+    @tf.function(jit_compile=True, reduce_retracing=True)
+    def _gather_matmul_values(node, dens_trafo, indexlist):
+        """Gather plus per-message matrix-vector product as one jit-compiled kernel, so the
+        gathered (M, F) intermediate is consumed in place by the einsum."""
+        dens_e = tf.gather(node, indexlist, axis=0)
+        return tf.einsum('mij,mj->mi', dens_trafo, dens_e)
+
+    def call(self, inputs, **kwargs):
+        """Forward pass.
+
+        Args:
+            inputs (list): [nodes, trafo_mat, edge_index]
+
+                - nodes (tf.RaggedTensor): Node embeddings of shape (batch, [N], F)
+                - trafo_mat (tf.RaggedTensor): Transformation matrix for each message of shape (batch, [M], F', F).
+                - edge_index (tf.RaggedTensor): Edge indices referring to nodes of shape (batch, [M], 2)
+
+        Returns:
+            tf.RaggedTensor: Transformed node embeddings per edge of shape (batch, [M], F')
+        """
+        inputs = self.assert_ragged_input_rank(inputs)
+        node, node_part = inputs[0].values, inputs[0].row_splits
+        dens_trafo = inputs[1].values
+        edge_index, edge_part = inputs[2].values, inputs[2].row_lengths()
+        indexlist = partition_row_indexing(edge_index, node_part, edge_part,
+                                           partition_type_target="row_splits",
+                                           partition_type_index="row_length",
+                                           to_indexing='batch',
+                                           from_indexing=self.node_indexing)
+        out = self._gather_matmul_values(node, dens_trafo, tf.gather(indexlist, self.selection_index, axis=1))
+        return tf.RaggedTensor.from_row_lengths(out, edge_part, validate=self.ragged_validate)
+
+    def get_config(self):
+        """Update layer config."""
+        config = super(GatherTrafoMessages, self).get_config()
+        config.update({"selection_index": self.selection_index})
+        return config
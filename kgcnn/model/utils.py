@@ -66,6 +66,44 @@ def generate_embedding(inputs, input_shape: list, embedding_args: dict, embeddin
     return n
 
 
+def trace_model_call(model, batch_size: int = None, jit_compile: bool = False):
+    r"""Trace the call of a keras model once for a fixed batch size.
+
+    Models with ragged input are retraced by :obj:`tf.function` whenever the (composite) input shape
+    changes, e.g. for a smaller final batch of an epoch. Pinning the batch dimension in the input
+    signature yields a single concrete function that is traced up front and reused for every call.
+    Note that the ragged row lengths remain dynamic within the trace; only the batch partition size
+    is fixed. Intended for inference or benchmark loops that feed constant-size batches, since
+    :obj:`fit` manages its own train function.
+
+    Args:
+        model (tf.keras.models.Model): Functional keras model to trace.
+        batch_size (int): Static batch size to pin in the input signature. Default is None.
+        jit_compile (bool): Whether to request XLA compilation for the traced function. Only
+            possible if the model graph is free of ragged operations. Default is False.
+
+    Returns:
+        ConcreteFunction: Traced model call that accepts the list of model inputs.
+    """
+    signature = []
+    for x in model.inputs:
+        spec = x.type_spec
+        if batch_size is not None:
+            if isinstance(spec, tf.RaggedTensorSpec):
+                spec = tf.RaggedTensorSpec(
+                    shape=[batch_size] + spec.shape.as_list()[1:], dtype=spec.dtype,
+                    ragged_rank=spec.ragged_rank, row_splits_dtype=spec.row_splits_dtype)
+            else:
+                spec = tf.TensorSpec([batch_size] + spec.shape.as_list()[1:], dtype=spec.dtype)
+        signature.append(spec)
+
+    @tf.function(input_signature=[signature], jit_compile=jit_compile, reduce_retracing=True)
+    def model_call(inputs):
+        return model(inputs, training=False)
+
+    return model_call.get_concrete_function()
+
+
 def update_model_kwargs_logic(default_kwargs: dict = None, user_kwargs: dict = None,
                               update_recursive: Union[int, float] = inf):
     r"""Make model kwargs dictionary with updated default values. This is essentially a nested version of update()
@@ -90,31 +128,36 @@ def update_model_kwargs_logic(default_kwargs: dict = None, user_kwargs: dict = N
         if iter_key not in default_kwargs:
             raise ValueError("Model kwarg {0} not in default arguments {1}".format(iter_key, default_kwargs.keys()))
 
-    # Start with default values.
-    out = deepcopy(default_kwargs)
-
-    # Nested update of kwargs:
-    def _nested_update(dict1, dict2, max_depth=inf, depth=0):
-        for key, values in dict2.items():
-            if key not in dict1:
+    # Nested merge of kwargs. Instead of deep-copying all defaults upfront and updating in place,
+    # the output is built per key, so only default branches that survive the merge are copied and
+    # user values are taken over by reference as before.
+    def _nested_merge(defaults, updates, max_depth=inf, depth=0):
+        out = dict(defaults)
+        for key, values in updates.items():
+            if key not in out:
                 module_logger.warning("Model kwargs: Unknown key {0} with value {1}".format(key, values))
-                dict1[key] = values
+                out[key] = values
                 continue
-            if not isinstance(dict1[key], dict):
-                dict1[key] = values
+            if not isinstance(out[key], dict):
+                out[key] = values
                 continue
             if not isinstance(values, dict):
                 module_logger.warning("Model kwargs: Overwriting dictionary of {0} with {1}".format(key, values))
-                dict1[key] = values
+                out[key] = values
                 continue
             # Nested update.
             if depth < max_depth:
-                dict1[key] = _nested_update(dict1[key], values, max_depth=max_depth, depth=depth+1)
+                out[key] = _nested_merge(out[key], values, max_depth=max_depth, depth=depth + 1)
             else:
-                dict1[key] = values
-        return dict1
-
-    return _nested_update(out, user_kwargs, update_recursive, 0)
+                out[key] = values
+        # Copy mutable defaults that were not replaced, so the model function can not alter the
+        # default config through the returned kwargs.
+        for key, values in out.items():
+            if key not in updates and isinstance(values, (dict, list)):
+                out[key] = deepcopy(values)
+        return out
+
+    return _nested_merge(default_kwargs, user_kwargs, update_recursive, 0)
 
 
 def update_model_kwargs(model_default, update_recursive=inf):
@@ -17,7 +17,7 @@ hyper = {
                         "inputs": [
                             {"shape": [None], "name": "z", "dtype": "float32", "ragged": True},
                             {"shape": [None, 3], "name": "R", "dtype": "float32", "ragged": True},
-                            {"shape": [None, 2], "name": "range_indices", "dtype": "int64", "ragged": True}
+                            {"shape": [None, 2], "name": "range_indices", "dtype": "int32", "ragged": True}
                         ],
                         "input_embedding": {
                             "node": {"input_dim": 95, "output_dim": 128}
@@ -94,7 +94,7 @@ hyper = {
                         "inputs": [
                             {"shape": [None], "name": "z", "dtype": "float32", "ragged": True},
                             {"shape": [None, 3], "name": "R", "dtype": "float32", "ragged": True},
-                            {"shape": [None, 2], "name": "range_indices", "dtype": "int64", "ragged": True}
+                            {"shape": [None, 2], "name": "range_indices", "dtype": "int32", "ragged": True}
                         ],
                         "input_embedding": {"node": {"input_dim": 95, "output_dim": 128}},
                         "equiv_initialize_kwargs": {"dim": 3, "method": "eps"},
@@ -174,8 +174,8 @@ hyper = {
                         "name": "DimeNetPPEnergy",
                         "inputs": [{"shape": [None], "name": "z", "dtype": "float32", "ragged": True},
                                    {"shape": [None, 3], "name": "R", "dtype": "float32", "ragged": True},
-                                   {"shape": [None, 2], "name": "range_indices", "dtype": "int64", "ragged": True},
-                                   {"shape": [None, 2], "name": "angle_indices", "dtype": "int64", "ragged": True}],
+                                   {"shape": [None, 2], "name": "range_indices", "dtype": "int32", "ragged": True},
+                                   {"shape": [None, 2], "name": "angle_indices", "dtype": "int32", "ragged": True}],
                         "input_embedding": {"node": {"input_dim": 95, "output_dim": 128,
                                                      "embeddings_initializer": {
                                                          "class_name": "RandomUniform",
@@ -263,12 +263,12 @@ hyper = {
                         "name": "NMPNEnergy",
                         "inputs": [{"shape": [None], "name": "z", "dtype": "float32", "ragged": True},
                                    {"shape": [None, 3], "name": "R", "dtype": "float32", "ragged": True},
-                                   {"shape": [None, 2], "name": "range_indices", "dtype": "int64", "ragged": True}],
+                                   {"shape": [None, 2], "name": "range_indices", "dtype": "int32", "ragged": True}],
                         "input_embedding": {"node": {"input_dim": 95, "output_dim": 64},
                                             "edge": {"input_dim": 95, "output_dim": 64}},
                         "set2set_args": {"channels": 32, "T": 3, "pooling_method": "sum", "init_qstar": "0"},
-                        "pooling_args": {"pooling_method": "segment_sum"},
-                        "use_set2set": True,
+                        "pooling_args": {"pooling_method": "sum"},
+                        "use_set2set": False,
                         "depth": 3,
                         "node_dim": 128,
                         "verbose": 10,
@@ -338,7 +338,7 @@ hyper = {
                         "inputs": [
                             {"shape": [None], "name": "z", "dtype": "float32", "ragged": True},
                             {"shape": [None, 3], "name": "R", "dtype": "float32", "ragged": True},
-                            {"shape": [None, 2], "name": "range_indices", "dtype": "int64", "ragged": True},
+                            {"shape": [None, 2], "name": "range_indices", "dtype": "int32", "ragged": True},
                             {"shape": [3], "name": "graph_inertia", "dtype": "float32", "ragged": False}
                         ],
                         "input_embedding": {"node": {"input_dim": 100, "output_dim": 16},
@@ -418,10 +418,10 @@ hyper = {
                         "inputs": [{"shape": (None,), "name": "z", "dtype": "float32", "ragged": True},
                                    {"shape": (None, 3), "name": "R", "dtype": "float32", "ragged": True},
                                    {"shape": (None, 1), "name": "edge_weights", "dtype": "float32", "ragged": True},
-                                   {"shape": (None, 2), "name": "edge_indices", "dtype": "int64", "ragged": True},
-                                   {"shape": [None, 2], "name": "angle_indices_1", "dtype": "int64", "ragged": True},
-                                   {"shape": [None, 2], "name": "angle_indices_2", "dtype": "int64", "ragged": True},
-                                   {"shape": (None, 2), "name": "range_indices", "dtype": "int64", "ragged": True}],
+                                   {"shape": (None, 2), "name": "edge_indices", "dtype": "int32", "ragged": True},
+                                   {"shape": [None, 2], "name": "angle_indices_1", "dtype": "int32", "ragged": True},
+                                   {"shape": [None, 2], "name": "angle_indices_2", "dtype": "int32", "ragged": True},
+                                   {"shape": (None, 2), "name": "range_indices", "dtype": "int32", "ragged": True}],
                         "input_embedding": {
                             "node": {"input_dim": 95, "output_dim": 128, "embeddings_initializer": {
                                 "class_name": "RandomUniform",
@@ -519,7 +519,7 @@ hyper = {
                         "name": "EGNNEnergy",
                         "inputs": [{"shape": (None, 15), "name": "node_attributes", "dtype": "float32", "ragged": True},
                                {"shape": (None, 3), "name": "R", "dtype": "float32", "ragged": True},
-                               {"shape": (None, 2), "name": "range_indices", "dtype": "int64", "ragged": True},
+                               {"shape": (None, 2), "name": "range_indices", "dtype": "int32", "ragged": True},
                                {"shape": (None, 1), "name": "range_attributes", "dtype": "int64", "ragged": True}],
                         "input_embedding": {"node": {"input_dim": 95, "output_dim": 128},
                                             "edge": {"input_dim": 95, "output_dim": 128}},